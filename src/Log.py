@@ -13,10 +13,15 @@ precise timestamp formatting with microsecond resolution.
 Key features include:
 - Six distinct logging levels with configurable filtering thresholds
 - Thread-safe operations using mutex locking for all shared resources
+- Non-blocking producers: messages are queued and written by a single
+  background writer thread, so callers never wait on console or file I/O
 - Dual output capabilities (console and file) with independent configuration
 - Automatic log directory creation and file management
 - Thread ID tracking for multi-threaded application debugging
 - Format string support with robust error handling
+- TRACE_ENABLED flag so hot call sites can skip building trace messages
+- Plain module-level functions (log.debug(...)) with a Log class shim
+  kept for existing Log.debug(...) call sites
 
 This implementation follows DO-178C requirements for deterministic behavior,
 resource management, and exception handling in safety-critical systems.
@@ -25,11 +30,13 @@ management and conditional execution paths.
 """
 
 from enum import IntEnum
-from datetime import datetime
 import sys
 import os
-from typing import Any, Optional, TextIO
+import time
+from typing import Any, List, Optional, Tuple
 import threading
+import queue
+import atexit
 
 class LogLevel(IntEnum):
     TRACE = 0
@@ -40,110 +47,321 @@ class LogLevel(IntEnum):
     CRITICAL = 5 
     NONE = 6     
 
-class Log:
-    _level = LogLevel.DEBUG
-    _log_file: Optional[TextIO] = None
-    _log_file_path: Optional[str] = None
-    _use_console = True
-    _lock = threading.Lock()
-    
-    @staticmethod
-    def set_level(level: LogLevel) -> None:
-        Log._level = level
-    
-    @staticmethod
-    def set_log_file(file_path: str, append: bool = False) -> bool:
-        with Log._lock:
-            if Log._log_file is not None:
-                try:
-                    Log._log_file.close()
-                except Exception:
-                    pass
-                Log._log_file = None
-            
+# Precomputed "[LEVEL]" tags, avoids the enum .name lookup per message
+_LEVEL_BRACKET = {lvl: f"[{lvl.name}]" for lvl in LogLevel}
+
+# Module-level state: plain globals keep the hot path to LOAD_GLOBAL lookups
+_level = LogLevel.DEBUG
+# Raw OS file descriptor: entries are encoded once and written with os.write
+_log_fd: Optional[int] = None
+_log_file_path: Optional[str] = None
+_use_console = True
+_lock = threading.Lock()
+# (epoch second, formatted 'YYYY-mm-dd HH:MM:SS') swapped as one tuple
+_ts_cache = (-1, "")
+# Producers only enqueue; a single daemon thread performs all I/O
+_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_writer_thread: Optional[threading.Thread] = None
+# Per-thread cache of the preformatted "[thread_id]" tag
+_tls = threading.local()
+# Outputs whose failure was already reported by _report_write_error
+_reported_errors = set()
+# is_enabled(LogLevel.TRACE), kept current by set_level() and the output
+# setters, so hot call sites can guard trace messages with one attribute load
+TRACE_ENABLED = False
+
+
+def set_level(level: LogLevel) -> None:
+    global _level
+    _level = level
+    _refresh_trace_enabled()
+
+
+def is_enabled(level: LogLevel) -> bool:
+    # Lets callers skip building messages that would be discarded
+    return level >= _level and _log is not _log_none
+
+
+def _refresh_trace_enabled() -> None:
+    global TRACE_ENABLED
+    TRACE_ENABLED = is_enabled(LogLevel.TRACE)
+    Log.TRACE_ENABLED = TRACE_ENABLED
+
+
+def set_log_file(file_path: str, append: bool = False) -> bool:
+    global _log_fd, _log_file_path
+    _drain()
+    with _lock:
+        if _log_fd is not None:
             try:
-                log_dir = os.path.dirname(file_path)
-                if log_dir and not os.path.exists(log_dir):
-                    os.makedirs(log_dir)
-                
-                # Use 'a' for append mode or 'w' for create/recreate mode
-                mode = 'a' if append else 'w'
-                Log._log_file = open(file_path, mode, encoding='utf-8')
-                Log._log_file_path = file_path
-                return True
-            except Exception as e:
-                sys.stderr.write(f"Error opening log file {file_path}: {str(e)}\n")
-                Log._log_file = None
-                Log._log_file_path = None
-                return False
-    
-    @staticmethod
-    def get_log_file_path() -> Optional[str]:
-        return Log._log_file_path
-    
-    @staticmethod
-    def close_log_file() -> None:
-        with Log._lock:
-            if Log._log_file is not None:
-                try:
-                    Log._log_file.close()
-                except Exception:
-                    pass
-                Log._log_file = None
-                Log._log_file_path = None
-    
-    @staticmethod
-    def set_console_output(enabled: bool) -> None:
-        Log._use_console = enabled
-    
-    @staticmethod
-    def _log(level: LogLevel, message: Any, *args: Any) -> None:
-        if level >= Log._level and Log._level != LogLevel.NONE:
-            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-            level_name = level.name
-            thread_id = threading.get_ident()
+                os.close(_log_fd)
+            except Exception:
+                pass
+            _log_fd = None
+        
+        try:
+            log_dir = os.path.dirname(file_path)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
             
-            if args:
+            # O_APPEND for append mode or O_TRUNC for create/recreate mode
+            flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+            _log_fd = os.open(file_path, flags, 0o644)
+            _log_file_path = file_path
+            opened = True
+        except Exception as e:
+            sys.stderr.write(f"Error opening log file {file_path}: {str(e)}\n")
+            _log_fd = None
+            _log_file_path = None
+            opened = False
+        
+        _select_outputs()
+        return opened
+
+
+def get_log_file_path() -> Optional[str]:
+    return _log_file_path
+
+
+def close_log_file() -> None:
+    global _log_fd, _log_file_path
+    _drain()
+    with _lock:
+        if _log_fd is not None:
+            try:
+                os.close(_log_fd)
+            except Exception:
+                pass
+            _log_fd = None
+            _log_file_path = None
+        _select_outputs()
+
+
+def set_console_output(enabled: bool) -> None:
+    global _use_console
+    _drain()
+    with _lock:
+        _use_console = enabled
+        _select_outputs()
+
+
+def _select_outputs() -> None:
+    # Bind the writer variant matching the configured outputs, so the
+    # per-batch path carries no console/file checks. Call with _lock held.
+    global _write_batch, _log
+    if _use_console and _log_fd is not None:
+        _write_batch = _write_both
+    elif _use_console:
+        _write_batch = _write_console
+    elif _log_fd is not None:
+        _write_batch = _write_file
+    else:
+        _write_batch = _write_none
+    # With no output at all, skip formatting and queueing entirely
+    _log = _log_none if _write_batch is _write_none else _log_enqueue
+    _refresh_trace_enabled()
+
+
+def _log_none(level: LogLevel, message: Any, *args: Any) -> None:
+    pass
+
+
+def _log_enqueue(level: LogLevel, message: Any, *args: Any) -> None:
+    global _ts_cache
+    if level >= _level and _level != LogLevel.NONE:
+        t = time.time()
+        sec = int(t)
+        ts_sec, ts_prefix = _ts_cache
+        if sec != ts_sec:
+            ts_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            _ts_cache = (sec, ts_prefix)
+        now = f"{ts_prefix}.{int((t - sec) * 1000):03d}"
+        level_tag = _LEVEL_BRACKET[level]
+        thread_tag = getattr(_tls, 'tid_str', None)
+        if thread_tag is None:
+            thread_tag = f"[{threading.get_ident()}]"
+            _tls.tid_str = thread_tag
+        
+        if args:
+            if isinstance(message, str):
                 try:
                     message = message % args
                 except Exception as e:
                     message = f"{message} (Format error: {str(e)}, Args: {args})"
-            
-            log_entry = f"{now} [{level_name}] [{thread_id}] {message}"
-            
-            with Log._lock:
-                if Log._use_console:
-                    output = sys.stderr if level >= LogLevel.ERROR else sys.stdout
-                    print(log_entry, file=output, flush=True)
-                
-                if Log._log_file is not None:
-                    try:
-                        Log._log_file.write(log_entry + "\n")
-                        Log._log_file.flush()
-                    except Exception as e:
-                        print(f"Error writing to log file: {str(e)}", file=sys.stderr, flush=True)
-                        print(log_entry, file=sys.stderr, flush=True)
-    
-    @staticmethod
-    def trace(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.TRACE, message, *args)
-    
-    @staticmethod
-    def debug(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.DEBUG, message, *args)
-    
-    @staticmethod
-    def info(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.INFO, message, *args)
-    
-    @staticmethod
-    def warning(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.WARNING, message, *args)
-    
-    @staticmethod
-    def error(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.ERROR, message, *args)
-    
-    @staticmethod
-    def critical(message: Any, *args: Any) -> None:
-        Log._log(LogLevel.CRITICAL, message, *args)
\ No newline at end of file
+            else:
+                # Non-string message: no format spec to apply, print-style join
+                message = " ".join(map(str, (message,) + args))
+        
+        log_entry = f"{now} {level_tag} {thread_tag} {message}\n"
+        
+        _queue.put((level, log_entry))
+
+
+def _start_writer() -> None:
+    global _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        _writer_thread = threading.Thread(target=_writer_loop,
+                                          name="LogWriter", daemon=True)
+        _writer_thread.start()
+
+
+def _drain(timeout: float = 1.0) -> None:
+    # Block until everything queued so far has been written
+    writer = _writer_thread
+    if writer is None or not writer.is_alive() or threading.current_thread() is writer:
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
+
+
+def _writer_loop() -> None:
+    while True:
+        batch: List[Tuple[LogLevel, str]] = []
+        waiters: List[threading.Event] = []
+        item = _queue.get()
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                batch.append(item)
+            try:
+                item = _queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        try:
+            with _lock:
+                _write_batch(batch)
+        except Exception as e:
+            _report_write_error("writer", e)
+        
+        for waiter in waiters:
+            waiter.set()
+
+
+def _report_write_error(output: str, e: Exception) -> None:
+    # Tell the user once per output that entries are being lost; the
+    # interpreter's original stderr is used since sys.stderr may be the culprit
+    if output in _reported_errors:
+        return
+    _reported_errors.add(output)
+    stream = sys.__stderr__
+    if stream is not None:
+        try:
+            stream.write(f"Log: {output} output failed, entries dropped: {str(e)}\n")
+            stream.flush()
+        except Exception:
+            pass
+
+
+def _write_console(batch: List[Tuple[LogLevel, str]]) -> None:
+    # Windowless launches (pythonw) set sys.stdout / sys.stderr to None
+    try:
+        for level, log_entry in batch:
+            output = sys.stderr if level >= LogLevel.ERROR else sys.stdout
+            if output is not None:
+                output.write(log_entry)
+        for output in (sys.stdout, sys.stderr):
+            if output is not None:
+                output.flush()
+    except Exception as e:
+        _report_write_error("console", e)
+
+
+def _write_file(batch: List[Tuple[LogLevel, str]]) -> None:
+    # One encode and one os.write per batch, bypassing TextIOWrapper
+    buf = memoryview("".join(entry for _, entry in batch).encode('utf-8'))
+    try:
+        while buf:
+            written = os.write(_log_fd, buf)
+            buf = buf[written:]
+    except Exception as e:
+        _report_write_error("file", e)
+
+
+def _write_both(batch: List[Tuple[LogLevel, str]]) -> None:
+    # Each output reports its own failures, so a failing console
+    # does not cost the file its entries
+    _write_console(batch)
+    _write_file(batch)
+
+
+def _write_none(batch: List[Tuple[LogLevel, str]]) -> None:
+    pass
+
+
+# Active variants, rebound by _select_outputs()
+_write_batch = _write_console
+_log = _log_enqueue
+
+
+def sync() -> None:
+    # Force queued entries to stable storage (fsync); use sparingly,
+    # e.g. after WARNING+ messages that must survive a power loss
+    _drain()
+    with _lock:
+        if _log_fd is not None:
+            try:
+                os.fsync(_log_fd)
+            except Exception as e:
+                sys.stderr.write(f"Error syncing log file: {str(e)}\n")
+
+
+def trace(message: Any, *args: Any) -> None:
+    if LogLevel.TRACE < _level:
+        return
+    _log(LogLevel.TRACE, message, *args)
+
+
+def debug(message: Any, *args: Any) -> None:
+    if LogLevel.DEBUG < _level:
+        return
+    _log(LogLevel.DEBUG, message, *args)
+
+
+def info(message: Any, *args: Any) -> None:
+    if LogLevel.INFO < _level:
+        return
+    _log(LogLevel.INFO, message, *args)
+
+
+def warning(message: Any, *args: Any) -> None:
+    if LogLevel.WARNING < _level:
+        return
+    _log(LogLevel.WARNING, message, *args)
+
+
+def error(message: Any, *args: Any) -> None:
+    if LogLevel.ERROR < _level:
+        return
+    _log(LogLevel.ERROR, message, *args)
+
+
+def critical(message: Any, *args: Any) -> None:
+    if LogLevel.CRITICAL < _level:
+        return
+    _log(LogLevel.CRITICAL, message, *args)
+
+
+class Log:
+    # Backward-compatible namespace: Log.debug(...) still works, but new
+    # code should call the module-level functions directly
+    TRACE_ENABLED = False
+    set_level = staticmethod(set_level)
+    is_enabled = staticmethod(is_enabled)
+    set_log_file = staticmethod(set_log_file)
+    get_log_file_path = staticmethod(get_log_file_path)
+    close_log_file = staticmethod(close_log_file)
+    sync = staticmethod(sync)
+    set_console_output = staticmethod(set_console_output)
+    trace = staticmethod(trace)
+    debug = staticmethod(debug)
+    info = staticmethod(info)
+    warning = staticmethod(warning)
+    error = staticmethod(error)
+    critical = staticmethod(critical)
+
+
+_start_writer()
+atexit.register(_drain)
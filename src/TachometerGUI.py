@@ -19,13 +19,14 @@ import threading
 import time
 import queue
 import json
-from datetime import datetime
 from collections import deque
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as FigureCanvasTkinter
 from matplotlib.figure import Figure
-import matplotlib.animation as animation
+from matplotlib.ticker import MaxNLocator
+from matplotlib.animation import FuncAnimation
 
 from BrazilianFormatter import (
     format_rpm_br, 
@@ -34,7 +35,41 @@ from BrazilianFormatter import (
     format_revolutions_br
 )
 
-from Log import Log, LogLevel
+import Log as log
+from Log import LogLevel
+
+
+# One DATA sample, laid out in the field order sent by the Arduino.
+# 64-bit fields: millis() and the revolution counter overflow int32 on long runs.
+SAMPLE_DTYPE = np.dtype([
+    ('frequency', '<i8'),
+    ('rpm', '<i8'),
+    ('filtered_freq', '<i8'),
+    ('filtered_rpm', '<i8'),
+    ('total_revs', '<i8'),
+    ('raw_pulses', '<i8'),
+    ('pulse_interval', '<i8'),
+    ('timestamp', '<i8')
+])
+SAMPLE_FIELDS = len(SAMPLE_DTYPE.names)
+
+# Field order of the CONFIG payload
+CONFIG_KEYS = ('ir_pin', 'sample_period', 'debounce_time', 'pulses_per_rev',
+               'timer_number', 'filtering_enabled', 'filter_alpha', 'window_size')
+
+# (epoch second, 'YYYY-mm-dd HH:MM:SS') swapped as one tuple, see _now_str()
+_ts_cache = (-1, "")
+
+
+"""
+Current local time as 'YYYY-mm-dd HH:MM:SS', formatted at most once per second.
+"""
+def _now_str():
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)))
+    return _ts_cache[1]
 
 
 """
@@ -44,6 +79,38 @@ with thread-safe communication to Arduino via Serial protocol.
 """
 class TachometerGUI:
     APP_TITTLE = "Industrial Tachometer - v1.0 - Omar Achraf - omarachraf@gmail.com - UVSBR"
+    
+    # GUI log level -> log_text tag foreground color
+    _LEVEL_TAGS = {
+        "INFO": "blue",
+        "WARNING": "orange",
+        "ERROR": "red",
+        "SUCCESS": "green"
+    }
+    
+    # Known TACH: system messages -> (GUI log text, GUI log level, Log function)
+    _SYS_MSG_TABLE = {
+        "STARTUP": ("Arduino system starting up", "INFO", log.info),
+        "INIT_OK": ("Arduino initialization successful", "SUCCESS", log.info),
+        "INIT_ERROR": ("Arduino initialization failed", "ERROR", log.error)
+    }
+    
+    # Configuration tab text, filled with a single format() call
+    _CONFIG_TEMPLATE = (
+        "Current System Configuration:\n"
+        + "=" * 40 + "\n"
+        "IR Sensor Pin: {ir_pin}\n"
+        "Sample Period: {sample_period} ms\n"
+        "Debounce Time: {debounce_time} µs\n"
+        "Pulses per Revolution: {pulses_per_rev}\n"
+        "Timer Number: {timer_number}\n"
+        "Filtering Enabled: {filtering_enabled}\n"
+        "Filter Alpha: {filter_alpha}\n"
+        "Window Size: {window_size}\n"
+        "Last Updated: {updated}\n"
+    )
+    # Line and column of the timestamp within config_text
+    _CONFIG_UPDATED_INDEX = "%d.%d" % (_CONFIG_TEMPLATE.count("\n"), len("Last Updated: "))
 
     """
     Initialize GUI application and setup all components.
@@ -52,38 +119,71 @@ class TachometerGUI:
         header = "TachometerGUI.__init__()"
         
         # Initialize logging system first
-        Log.set_level(LogLevel.DEBUG)
-        Log.set_log_file("tachometer_gui.log", append=True)
-        Log.set_console_output(True)
+        log.set_level(LogLevel.DEBUG)
+        log.set_log_file("tachometer_gui.log", append=True)
+        log.set_console_output(True)
         
-        Log.trace(f"{header}: Starting Tachometer GUI application")
+        log.trace(f"{header}: Starting Tachometer GUI application")
         
         # Serial communication variables
         self.serial_port = None
-        self.serial_thread = None
-        self.data_queue = queue.Queue()
+        self.reader_thread = None
+        self.writer_thread = None
+        # Bounded so a stalled Tk loop cannot let it grow without limit (see _offer)
+        self.data_queue = queue.Queue(maxsize=256)
+        self._dropped_items = 0
         self.command_queue = queue.Queue()
         self.is_connected = False
         self.stop_threads = False
+        # Bytes received but not yet terminated by a newline (reader thread only)
+        self._rx_buf = bytearray()
+        # Pending debounced commands: command name -> Tk after() id
+        self._pending_sends = {}
+        # Last port enumeration and its time.monotonic() stamp
+        self._ports_cache = []
+        self._ports_cached_at = float("-inf")
+        
+        # Message prefix -> parser, looked up once per incoming line
+        self._handlers = {
+            'DATA': self._handle_data,
+            'CONFIG': self._handle_config,
+            'RESP': self._handle_resp,
+            'TACH': self._handle_tach
+        }
         
         # Data storage for plotting
         self.max_data_points = 100
-        self.time_data = deque(maxlen=self.max_data_points)
-        self.rpm_data = deque(maxlen=self.max_data_points)
-        self.filtered_rpm_data = deque(maxlen=self.max_data_points)
-        self.frequency_data = deque(maxlen=self.max_data_points)
-        
-        # Current measurements
-        self.current_data = {
-            'frequency': 0,
-            'rpm': 0,
-            'filtered_freq': 0,
-            'filtered_rpm': 0,
-            'total_revs': 0,
-            'raw_pulses': 0,
-            'pulse_interval': 0,
-            'timestamp': 0
-        }
+        # Preallocated ring buffers: _head is the next write slot, _count the fill level.
+        # Values are float32 (exact for integers below 2**24); time stays float64
+        # because absolute millis() seconds lose sub-second precision in float32.
+        self._buf_time = np.empty(self.max_data_points, dtype=np.float64)
+        self._buf_rpm = np.empty(self.max_data_points, dtype=np.float32)
+        self._buf_filtered_rpm = np.empty(self.max_data_points, dtype=np.float32)
+        self._buf_freq = np.empty(self.max_data_points, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        self._plot_dirty = False
+        # Running y bounds of the buffered data (RPM axis covers raw and filtered),
+        # kept up to date per sample; recomputed only when an extreme is evicted
+        self._rpm_lo = self._rpm_hi = 0
+        self._freq_lo = self._freq_hi = 0
+        self._bounds_stale = True
+        # Chronologically ordered copies handed to the plot lines, reused every refresh.
+        # float64 is what Line2D stores internally, so set_data needs no further conversion.
+        self._rel_time = np.empty(self.max_data_points, dtype=np.float64)
+        self._plot_rpm = np.empty(self.max_data_points, dtype=np.float64)
+        self._plot_filtered_rpm = np.empty(self.max_data_points, dtype=np.float64)
+        self._plot_freq = np.empty(self.max_data_points, dtype=np.float64)
+        
+        # Current measurements (SAMPLE_DTYPE record, fields indexed by name)
+        self.current_data = np.zeros(1, dtype=SAMPLE_DTYPE)[0]
+        # Values currently on the digital displays, to skip unchanged updates
+        self._last_shown = dict.fromkeys(('rpm', 'filtered_rpm', 'frequency',
+                                          'filtered_freq', 'total_revs', 'pulse_interval'))
+        # Window minimized (polled every 500 ms); displays are then left alone
+        # and the latest sample waits in _deferred_data until the window maps again
+        self._iconic = False
+        self._deferred_data = None
         
         # System configuration
         self.config = {
@@ -104,8 +204,9 @@ class TachometerGUI:
         
         # Start GUI update timer
         self.update_gui_timer()
+        self._poll_window_state()
         
-        Log.info(f"{header}: GUI initialization complete")
+        log.info(f"{header}: GUI initialization complete")
 
 
     """
@@ -113,7 +214,7 @@ class TachometerGUI:
     """
     def create_main_window(self):
         header = "TachometerGUI.create_main_window()"
-        Log.trace(f"{header}: Creating main application window")
+        log.trace(f"{header}: Creating main application window")
         
         self.root = tk.Tk()
         self.root.title(self.APP_TITTLE)
@@ -140,8 +241,9 @@ class TachometerGUI:
         
         # Handle window closing
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.bind('<Map>', self._on_map)
         
-        Log.debug(f"{header}: Main window configured successfully")
+        log.debug(f"{header}: Main window configured successfully")
 
 
     """
@@ -149,19 +251,46 @@ class TachometerGUI:
     """
     def create_widgets(self):
         header = "TachometerGUI.create_widgets()"
-        Log.trace(f"{header}: Creating GUI widgets")
+        log.trace(f"{header}: Creating GUI widgets")
         
         # Create main notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Create tabs
+        # Only the monitor tab is built up front; the others get an empty
+        # frame now and their widgets on first selection (see _lazy_tab)
         self.create_monitor_tab()
-        self.create_control_tab()
-        self.create_config_tab()
-        self.create_log_tab()
         
-        Log.debug(f"{header}: All GUI widgets created successfully")
+        self.control_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.control_frame, text="🎛️ System Control")
+        self.config_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.config_frame, text="⚙️ Configuration")
+        self.log_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.log_frame, text="📋 System Log")
+        
+        self._built = set()
+        self._tab_creators = {
+            str(self.control_frame): ('control', self.create_control_tab),
+            str(self.config_frame): ('config', self.create_config_tab),
+            str(self.log_frame): ('log', self.create_log_tab)
+        }
+        # Log lines waiting for the next flush (see _flush_log); they also
+        # accumulate here until the log tab is first opened
+        self._log_pending = deque(maxlen=2000)
+        self.max_log_lines = 5000
+        # UTF-8 copy of the log widget contents, trimmed with it, for save_log
+        self._log_bytes = bytearray()
+        # Lines inserted since the last size check; trimming runs every 256
+        self._log_lines_since_trim = 0
+        # An after_idle scroll to the end is already scheduled
+        self._see_pending = False
+        # Config text issued before the config tab exists
+        self._last_config_text = None
+        # Settings currently rendered in config_text
+        self._shown_config = None
+        self.notebook.bind('<<NotebookTabChanged>>', self._lazy_tab)
+        
+        log.debug(f"{header}: All GUI widgets created successfully")
 
 
     """
@@ -169,7 +298,7 @@ class TachometerGUI:
     """
     def create_monitor_tab(self):
         header = "TachometerGUI.create_monitor_tab()"
-        Log.trace(f"{header}: Creating monitoring tab")
+        log.trace(f"{header}: Creating monitoring tab")
         
         # Monitor tab frame
         self.monitor_frame = ttk.Frame(self.notebook)
@@ -185,7 +314,7 @@ class TachometerGUI:
         self.port_combo.grid(row=0, column=1, padx=5)
         
         ttk.Button(status_frame, text="Refresh Ports", 
-                  command=self.refresh_ports).grid(row=0, column=2, padx=5)
+                  command=lambda: self.refresh_ports(force=True)).grid(row=0, column=2, padx=5)
         
         self.connect_btn = ttk.Button(status_frame, text="Connect", 
                                      command=self.toggle_connection)
@@ -212,7 +341,7 @@ class TachometerGUI:
         self.monitor_frame.columnconfigure(1, weight=2)
         self.monitor_frame.rowconfigure(1, weight=1)
         
-        Log.debug(f"{header}: Monitor tab created successfully")
+        log.debug(f"{header}: Monitor tab created successfully")
 
 
     """
@@ -220,7 +349,7 @@ class TachometerGUI:
     """
     def create_measurement_displays(self, parent):
         header = "TachometerGUI.create_measurement_displays()"
-        Log.trace(f"{header}: Creating measurement displays")
+        log.trace(f"{header}: Creating measurement displays")
         
         # Measurement variables
         self.rpm_var = tk.StringVar(value="0")
@@ -230,6 +359,16 @@ class TachometerGUI:
         self.total_revs_var = tk.StringVar(value="0")
         self.pulse_interval_var = tk.StringVar(value="0")
         
+        # Sample field -> display variable and formatter, used by update_measurements
+        self._measurement_fields = (
+            ('rpm', self.rpm_var, format_rpm_br),
+            ('filtered_rpm', self.filtered_rpm_var, format_rpm_br),
+            ('frequency', self.frequency_var, format_frequency_br),
+            ('filtered_freq', self.filtered_freq_var, format_frequency_br),
+            ('total_revs', self.total_revs_var, format_revolutions_br),
+            ('pulse_interval', self.pulse_interval_var, format_time_br)
+        )
+        
         # Create display widgets
         displays = [
             ("RPM (Raw)", self.rpm_var, "cyan"),
@@ -254,7 +393,7 @@ class TachometerGUI:
         
         parent.columnconfigure(1, weight=1)
         
-        Log.trace(f"{header}: Measurement displays created successfully")
+        log.trace(f"{header}: Measurement displays created successfully")
 
 
     """
@@ -262,11 +401,7 @@ class TachometerGUI:
     """
     def create_control_tab(self):
         header = "TachometerGUI.create_control_tab()"
-        Log.trace(f"{header}: Creating control tab")
-        
-        # Control tab frame
-        self.control_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.control_frame, text="🎛️ System Control")
+        log.trace(f"{header}: Creating control tab")
         
         # Reset controls frame
         reset_frame = ttk.LabelFrame(self.control_frame, text="Reset Operations", padding=10)
@@ -321,7 +456,7 @@ class TachometerGUI:
         # Configure grid weights
         self.control_frame.columnconfigure(0, weight=1)
         
-        Log.debug(f"{header}: Control tab created successfully")
+        log.debug(f"{header}: Control tab created successfully")
 
 
     """
@@ -329,11 +464,7 @@ class TachometerGUI:
     """
     def create_config_tab(self):
         header = "TachometerGUI.create_config_tab()"
-        Log.trace(f"{header}: Creating configuration tab")
-        
-        # Config tab frame
-        self.config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.config_frame, text="⚙️ Configuration")
+        log.trace(f"{header}: Creating configuration tab")
         
         # System parameters frame
         params_frame = ttk.LabelFrame(self.config_frame, text="System Parameters", padding=10)
@@ -368,7 +499,7 @@ class TachometerGUI:
         self.config_frame.columnconfigure(0, weight=1)
         self.config_frame.rowconfigure(1, weight=1)
         
-        Log.debug(f"{header}: Configuration tab created successfully")
+        log.debug(f"{header}: Configuration tab created successfully")
 
 
     """
@@ -376,11 +507,7 @@ class TachometerGUI:
     """
     def create_log_tab(self):
         header = "TachometerGUI.create_log_tab()"
-        Log.trace(f"{header}: Creating log tab")
-        
-        # Log tab frame
-        self.log_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.log_frame, text="📋 System Log")
+        log.trace(f"{header}: Creating log tab")
         
         # Log controls frame
         log_controls = ttk.Frame(self.log_frame)
@@ -402,12 +529,40 @@ class TachometerGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Configure log text tags for colored output
-        self.log_text.tag_config("INFO", foreground="blue")
-        self.log_text.tag_config("WARNING", foreground="orange")
-        self.log_text.tag_config("ERROR", foreground="red")
-        self.log_text.tag_config("SUCCESS", foreground="green")
+        for tag, color in self._LEVEL_TAGS.items():
+            self.log_text.tag_config(tag, foreground=color)
         
-        Log.debug(f"{header}: Log tab created successfully")
+        log.debug(f"{header}: Log tab created successfully")
+
+
+    """
+    Build a tab's widgets the first time it is selected.
+    """
+    def _lazy_tab(self, event=None):
+        header = "TachometerGUI._lazy_tab()"
+        
+        entry = self._tab_creators.get(self.notebook.select())
+        if entry is None or entry[0] in self._built:
+            return
+        
+        key, creator = entry
+        log.trace(f"{header}: Building '{key}' tab on first use")
+        creator()
+        self._built.add(key)
+        
+        if key == 'log':
+            # Show messages logged before the tab existed
+            self._flush_log()
+        elif key == 'config':
+            if self._last_config_text is not None:
+                self.config_text.insert(1.0, self._last_config_text)
+            self.debounce_var.set(self.config['debounce_time'])
+            self.period_var.set(self.config['sample_period'])
+        else:
+            self.alpha_var.set(self.config['filter_alpha'])
+            self.window_var.set(self.config['window_size'])
+            self.alpha_label.config(text=str(self.config['filter_alpha']))
+            self.window_label.config(text=str(self.config['window_size']))
 
 
     """
@@ -415,11 +570,11 @@ class TachometerGUI:
     """
     def setup_plotting(self):
         header = "TachometerGUI.setup_plotting()"
-        Log.trace(f"{header}: Setting up real-time charts")
+        log.trace(f"{header}: Setting up real-time charts")
                
         try:
-            # Create matplotlib figure
-            self.fig = Figure(figsize=(8, 6), dpi=100)
+            # Create matplotlib figure (small raster: fewer pixels per redraw)
+            self.fig = Figure(figsize=(6, 4), dpi=80)
             self.fig.patch.set_facecolor('white')
             
             # Create subplots
@@ -436,10 +591,20 @@ class TachometerGUI:
             self.ax2.set_ylabel("Frequency (Hz)")
             self.ax2.grid(True, alpha=0.3)
             
-            # Create plot lines
-            self.rpm_line, = self.ax1.plot([], [], 'b-', label='Raw RPM', linewidth=2)
-            self.filtered_rpm_line, = self.ax1.plot([], [], 'r-', label='Filtered RPM', linewidth=2)
-            self.freq_line, = self.ax2.plot([], [], 'g-', label='Frequency', linewidth=2)
+            # Fixed limits: rescaled by _refresh_plot only when data leaves them
+            # A few fixed-count ticks keep tick label layout cheap
+            for ax in (self.ax1, self.ax2):
+                ax.set_autoscale_on(False)
+                ax.set_xlim(0, 10)
+                ax.xaxis.set_major_locator(MaxNLocator(5))
+                ax.yaxis.set_major_locator(MaxNLocator(5))
+            self.ax1.set_ylim(0, 1000)
+            self.ax2.set_ylim(0, 100)
+            
+            # Create plot lines (animated: left out of full draws, blitted by the animation)
+            self.rpm_line, = self.ax1.plot([], [], 'b-', label='Raw RPM', linewidth=2, animated=True)
+            self.filtered_rpm_line, = self.ax1.plot([], [], 'r-', label='Filtered RPM', linewidth=2, animated=True)
+            self.freq_line, = self.ax2.plot([], [], 'g-', label='Frequency', linewidth=2, animated=True)
             
             # Add legends
             self.ax1.legend()
@@ -449,39 +614,118 @@ class TachometerGUI:
             self.canvas = FigureCanvasTkinter(self.fig, self.chart_frame)
             self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
-            # Setup animation
-            self.anim = animation.FuncAnimation(self.fig, self.update_plots, 
-                                              interval=200, blit=False)
+            # Blitted animation: frames come from _plot_frames, which reports
+            # whether update_gui_timer appended samples since the last frame
+            self.anim = FuncAnimation(self.fig, self._animate, frames=self._plot_frames,
+                                      interval=50, blit=True, cache_frame_data=False)
             
-            Log.info(f"{header}: Chart setup completed successfully")
+            log.info(f"{header}: Chart setup completed successfully")
             
         except Exception as e:
-            Log.error(f"{header}: Error setting up charts - {str(e)}")
+            log.error(f"{header}: Error setting up charts - {str(e)}")
             self.log_message(f"Chart setup error: {str(e)}", "ERROR")
 
 
+    """
+    Frame source for the plot animation: yields True when new samples were
+    added since the previous frame, False otherwise.
+    """
+    def _plot_frames(self):
+        while True:
+            new_samples = self._plot_dirty
+            self._plot_dirty = False
+            yield new_samples
+
+
+    """
+    Track whether the main window is minimized. state() is a Tcl round-trip,
+    so it is sampled every 500 ms instead of on every update.
+    """
+    def _poll_window_state(self):
+        header = "TachometerGUI._poll_window_state()"
+        
+        try:
+            self._set_iconic(self.root.state() == 'iconic')
+        except Exception as e:
+            log.error(f"{header}: Error reading window state - {str(e)}")
+        
+        self.root.after(500, self._poll_window_state)
+
+
+    """
+    Record a change of the minimized state and pause or resume the plot
+    animation with it, so no frames run while nothing is visible.
+    """
+    def _set_iconic(self, iconic):
+        if iconic == self._iconic:
+            return
+        self._iconic = iconic
+        if iconic:
+            self.anim.pause()
+        else:
+            self.anim.resume()
+
+
+    """
+    Bring displays and log up to date when the main window is shown again.
+    """
+    def _on_map(self, event):
+        header = "TachometerGUI._on_map()"
+        
+        # <Map> on the root binding also fires for every child widget
+        if event.widget is not self.root:
+            return
+        
+        try:
+            self._set_iconic(False)
+            if self._deferred_data is not None:
+                self.update_measurements(self._deferred_data)
+                self._deferred_data = None
+            self._flush_log()
+            
+        except Exception as e:
+            log.error(f"{header}: Error refreshing restored window - {str(e)}")
+
+
+    """
+    Animation callback: returns the artists to blit. Idle frames return the
+    lines unchanged; an empty tuple would make the animation fall back to a
+    full canvas draw, which leaves the animated lines out.
+    """
+    def _animate(self, new_samples):
+        if new_samples and self._refresh_plot():
+            # Ticks changed: redraw the static background, the animation
+            # re-caches it before blitting the lines
+            self.canvas.draw()
+        return (self.rpm_line, self.filtered_rpm_line, self.freq_line)
+
+
     """
     Refresh available serial ports list.
     """
-    def refresh_ports(self):
+    def refresh_ports(self, force=False):
         header = "TachometerGUI.refresh_ports()"
-        Log.trace(f"{header}: Refreshing serial ports")
+        log.trace(f"{header}: Refreshing serial ports")
         
         try:
-            ports = serial.tools.list_ports.comports()
-            port_list = [port.device for port in ports]
+            # Enumeration walks sysfs / the registry, reuse it for 2 s unless forced
+            now = time.monotonic()
+            if force or now - self._ports_cached_at >= 2.0:
+                self._ports_cache = [port.device for port in serial.tools.list_ports.comports()]
+                self._ports_cached_at = now
+            port_list = self._ports_cache
             
             self.port_combo['values'] = port_list
             if port_list:
                 self.port_combo.current(0)
-                Log.info(f"{header}: Found {len(port_list)} serial ports")
+                log.info(f"{header}: Found {len(port_list)} serial ports")
                 self.log_message(f"Found {len(port_list)} serial ports", "INFO")
             else:
-                Log.warning(f"{header}: No serial ports found")
+                log.warning(f"{header}: No serial ports found")
                 self.log_message("No serial ports found", "WARNING")
                 
         except Exception as e:
-            Log.error(f"{header}: Error refreshing ports - {str(e)}")
+            log.error(f"{header}: Error refreshing ports - {str(e)}")
             self.log_message(f"Error refreshing ports: {str(e)}", "ERROR")
 
 
@@ -496,32 +740,39 @@ class TachometerGUI:
             try:
                 port = self.port_combo.get()
                 if not port:
-                    Log.warning(f"{header}: No port selected for connection")
+                    log.warning(f"{header}: No port selected for connection")
                     messagebox.showerror("Error", "Please select a serial port")
                     return
                 
-                Log.info(f"{header}: Attempting connection to {port}")
-                self.serial_port = serial.Serial(port, 115200, timeout=1)
+                log.info(f"{header}: Attempting connection to {port}")
+                # Short timeout: read() blocks in the OS until data or 50 ms
+                self.serial_port = serial.Serial(port, 115200, timeout=0.05)
                 time.sleep(2)  # Wait for Arduino reset
                 
-                # Start communication thread
+                # Start reader and writer threads (connected flag first: the
+                # reader loop exits immediately if it sees is_connected False)
                 self.stop_threads = False
-                self.serial_thread = threading.Thread(target=self.serial_communication_thread)
-                self.serial_thread.daemon = True
-                self.serial_thread.start()
-                
                 self.is_connected = True
+                self._rx_buf = bytearray()
+                self.reader_thread = threading.Thread(target=self.serial_reader_thread)
+                self.reader_thread.daemon = True
+                self.reader_thread.start()
+                self.writer_thread = threading.Thread(target=self.serial_writer_thread)
+                self.writer_thread.daemon = True
+                self.writer_thread.start()
+                
                 self.connect_btn.config(text="Disconnect")
                 self.status_label.config(text="Connected")
                 
-                Log.info(f"{header}: Successfully connected to {port}")
+                log.info(f"{header}: Successfully connected to {port}")
                 self.log_message(f"Connected to {port}", "SUCCESS")
                 
                 # Request initial configuration
                 self.send_command("GET_CONFIG")
                 
             except Exception as e:
-                Log.error(f"{header}: Connection error - {str(e)}")
+                self.is_connected = False
+                log.error(f"{header}: Connection error - {str(e)}")
                 self.log_message(f"Connection failed: {str(e)}", "ERROR")
                 messagebox.showerror("Connection Error", str(e))
         else:
@@ -534,147 +785,235 @@ class TachometerGUI:
     """
     def disconnect(self):
         header = "TachometerGUI.disconnect()"
-        Log.trace(f"{header}: Disconnecting from Arduino")
+        log.trace(f"{header}: Disconnecting from Arduino")
         
         try:
             self.stop_threads = True
+            # Sentinel wakes the writer thread blocked on command_queue
+            self.command_queue.put(None)
             
-            if self.serial_thread and self.serial_thread.is_alive():
-                self.serial_thread.join(timeout=2)
-                Log.debug(f"{header}: Serial communication thread stopped")
+            for thread in (self.reader_thread, self.writer_thread):
+                if thread and thread.is_alive():
+                    thread.join(timeout=2)
+            log.debug(f"{header}: Serial reader/writer threads stopped")
             
             if self.serial_port and self.serial_port.is_open:
                 self.serial_port.close()
-                Log.debug(f"{header}: Serial port closed")
+                log.debug(f"{header}: Serial port closed")
             
             self.is_connected = False
             self.connect_btn.config(text="Connect")
             self.status_label.config(text="Disconnected")
             
-            Log.info(f"{header}: Successfully disconnected from Arduino")
+            log.info(f"{header}: Successfully disconnected from Arduino")
             self.log_message("Disconnected from Arduino", "INFO")
             
         except Exception as e:
-            Log.error(f"{header}: Disconnect error - {str(e)}")
+            log.error(f"{header}: Disconnect error - {str(e)}")
             self.log_message(f"Disconnect error: {str(e)}", "ERROR")
 
 
     """
-    Background thread for serial communication with Arduino.
+    Background thread reading from Arduino. Reads everything available per
+    wake-up and splits it into lines, so a burst costs one read() call.
     """
-    def serial_communication_thread(self):
-        header = "TachometerGUI.serial_communication_thread()"
-        Log.trace(f"{header}: Starting serial communication thread")
+    def serial_reader_thread(self):
+        header = "TachometerGUI.serial_reader_thread()"
+        log.trace(f"{header}: Starting serial reader thread")
+        
+        port = self.serial_port
+        rx_buf = self._rx_buf
         
         while not self.stop_threads and self.is_connected:
             try:
-                # Send pending commands
-                while not self.command_queue.empty():
-                    command = self.command_queue.get_nowait()
-                    self.serial_port.write(f"CMD:{command}\n".encode())
-                    self.serial_port.flush()
-                    Log.trace(f"{header}: Sent command: {command}")
+                # Blocks until at least one byte or timeout (empty result)
+                chunk = port.read(port.in_waiting or 1)
+                if not chunk:
+                    continue
+                
+                rx_buf += chunk
+                end = rx_buf.rfind(b'\n')
+                if end < 0:
+                    continue
                 
-                # Read incoming data
-                if self.serial_port.in_waiting > 0:
-                    line = self.serial_port.readline().decode().strip()
+                # All complete lines at once; the partial tail stays buffered
+                lines = rx_buf[:end].decode(errors='replace').split('\n')
+                del rx_buf[:end + 1]
+                
+                for line in lines:
+                    line = line.strip()
                     if line:
-                        Log.trace(f"{header}: Received: {line}")
+                        if log.TRACE_ENABLED:
+                            log.trace("%s: Received: %s", header, line)
                         self.process_incoming_data(line)
                 
-                time.sleep(0.01)  # Small delay to prevent CPU overload
+            except Exception as e:
+                log.error(f"{header}: Communication error - {str(e)}")
+                self.log_message(f"Communication error: {str(e)}", "ERROR")
+                break
+        
+        log.debug(f"{header}: Serial reader thread stopped")
+
+
+    """
+    Background thread sending queued commands to Arduino.
+    """
+    def serial_writer_thread(self):
+        header = "TachometerGUI.serial_writer_thread()"
+        log.trace(f"{header}: Starting serial writer thread")
+        
+        while not self.stop_threads and self.is_connected:
+            try:
+                commands = self.command_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            
+            # None is the wake-up sentinel posted by disconnect()
+            if commands is None:
+                continue
+            
+            try:
+                # One write per batch; the Arduino still reads one CMD line at a time
+                self.serial_port.write("".join(f"CMD:{command}\n" for command in commands).encode())
+                self.serial_port.flush()
+                if log.TRACE_ENABLED:
+                    log.trace("%s: Sent commands: %s", header, commands)
                 
             except Exception as e:
-                Log.error(f"{header}: Communication error - {str(e)}")
+                log.error(f"{header}: Communication error - {str(e)}")
                 self.log_message(f"Communication error: {str(e)}", "ERROR")
                 break
         
-        Log.debug(f"{header}: Serial communication thread stopped")
+        log.debug(f"{header}: Serial writer thread stopped")
 
 
     """
     Process data received from Arduino.
     """
     def process_incoming_data(self, line):
-        header = "TachometerGUI.process_incoming_data()"
-        
         try:
-            if line.startswith("DATA:"):
-                # Parse measurement data
-                data_str = line[5:]  # Remove "DATA:" prefix
-                values = data_str.split(',')
-                
-                if len(values) >= 8:
-                    self.current_data = {
-                        'frequency': int(values[0]),
-                        'rpm': int(values[1]),
-                        'filtered_freq': int(values[2]),
-                        'filtered_rpm': int(values[3]),
-                        'total_revs': int(values[4]),
-                        'raw_pulses': int(values[5]),
-                        'pulse_interval': int(values[6]),
-                        'timestamp': int(values[7])
-                    }
-                    
-                    # Add to data queue for GUI update
-                    self.data_queue.put(('DATA', self.current_data))
-                    Log.trace(f"{header}: Parsed measurement data successfully")
-                    
-            elif line.startswith("CONFIG:"):
-                # Parse configuration data
-                config_str = line[7:]  # Remove "CONFIG:" prefix
-                values = config_str.split(',')
-                
-                if len(values) >= 8:
-                    self.config = {
-                        'ir_pin': int(values[0]),
-                        'sample_period': int(values[1]),
-                        'debounce_time': int(values[2]),
-                        'pulses_per_rev': int(values[3]),
-                        'timer_number': int(values[4]),
-                        'filtering_enabled': bool(int(values[5])),
-                        'filter_alpha': int(values[6]),
-                        'window_size': int(values[7])
-                    }
-                    
-                    self.data_queue.put(('CONFIG', self.config))
-                    Log.debug(f"{header}: Configuration data received and parsed")
-                    
-            elif line.startswith("RESP:"):
-                # Handle command responses
-                response = line[5:]  # Remove "RESP:" prefix
-                self.data_queue.put(('RESPONSE', response))
-                Log.debug(f"{header}: Command response received: {response}")
-                
-            elif line.startswith("TACH:"):
-                # Handle system messages
-                message = line[5:]  # Remove "TACH:" prefix
-                self.data_queue.put(('SYSTEM', message))
-                Log.debug(f"{header}: System message received: {message}")
-                
+            prefix, _, payload = line.partition(':')
+            handler = self._handlers.get(prefix)
+            
+            if handler is not None:
+                handler(payload)
             else:
                 # Unknown message format
-                self.data_queue.put(('RAW', line))
-                Log.warning(f"{header}: Unknown message format: {line}")
+                self._offer(('RAW', line))
+                log.warning("TachometerGUI.process_incoming_data(): Unknown message format: %s", line)
                 
         except Exception as e:
-            Log.error(f"{header}: Error parsing data '{line}' - {str(e)}")
+            log.error(f"TachometerGUI.process_incoming_data(): Error parsing data '{line}' - {str(e)}")
             self.log_message(f"Data parsing error: {str(e)}", "ERROR")
 
 
+    """
+    Put an item on data_queue without blocking the reader thread.
+    When the queue is full the oldest DATA sample is dropped to make room;
+    CONFIG, RESPONSE and other messages are never discarded for a sample.
+    """
+    def _offer(self, item):
+        try:
+            self.data_queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        
+        q = self.data_queue
+        with q.mutex:
+            pending = q.queue
+            for i, (data_type, _) in enumerate(pending):
+                if data_type == 'DATA':
+                    del pending[i]
+                    break
+            else:
+                if item[0] == 'DATA':
+                    # Only control messages queued: drop the new sample instead
+                    item = None
+                else:
+                    pending.popleft()
+            if item is not None:
+                pending.append(item)
+                q.not_empty.notify()
+        
+        self._dropped_items += 1
+        log.debug("TachometerGUI._offer(): Data queue full, %d items dropped so far", self._dropped_items)
+
+
+    """
+    Parse a DATA payload (measurement values) and queue it for the GUI.
+    """
+    def _handle_data(self, payload):
+        fields = payload.split(',')
+        if len(fields) >= SAMPLE_FIELDS:
+            # int() rejects empty or malformed fields (ValueError, logged by
+            # process_incoming_data). One array per sample, deliberately not a reused
+            # buffer: the reader thread runs ahead of the GUI tick and every queued
+            # sample is plotted
+            values = np.fromiter(map(int, fields[:SAMPLE_FIELDS]), dtype=np.int64,
+                                 count=SAMPLE_FIELDS)
+            self.current_data = values.view(SAMPLE_DTYPE)[0]
+            
+            # Add to data queue for GUI update
+            self._offer(('DATA', self.current_data))
+            if log.TRACE_ENABLED:
+                log.trace("TachometerGUI._handle_data(): Parsed measurement data successfully")
+
+
+    """
+    Parse a CONFIG payload (system parameters) and queue it for the GUI.
+    """
+    def _handle_config(self, payload):
+        fields = payload.split(',')
+        if len(fields) >= len(CONFIG_KEYS):
+            # int() rejects empty or malformed fields, as in _handle_data
+            config = dict(zip(CONFIG_KEYS, map(int, fields)))
+            config['filtering_enabled'] = bool(config['filtering_enabled'])
+            self.config = config
+            
+            self._offer(('CONFIG', self.config))
+            log.debug("TachometerGUI._handle_config(): Configuration data received and parsed")
+
+
+    """
+    Queue a command response (RESP payload) for the GUI.
+    """
+    def _handle_resp(self, payload):
+        self._offer(('RESPONSE', payload))
+        log.debug("TachometerGUI._handle_resp(): Command response received: %s", payload)
+
+
+    """
+    Queue a system message (TACH payload) for the GUI.
+    """
+    def _handle_tach(self, payload):
+        self._offer(('SYSTEM', payload))
+        log.debug("TachometerGUI._handle_tach(): System message received: %s", payload)
+
+
     """
     Send command to Arduino.
     """
     def send_command(self, command):
-        header = f"TachometerGUI.send_command(command={command})"
-        Log.trace(f"{header}: Sending command to Arduino")
+        self.send_commands((command,))
+
+
+    """
+    Send several commands to Arduino in a single serial write.
+    """
+    def send_commands(self, commands):
+        header = "TachometerGUI.send_commands()"
+        commands = tuple(commands)
+        # Arguments are passed unformatted; Log only formats what it emits
+        log.trace("%s: Sending commands %s to Arduino", header, commands)
         
         if self.is_connected:
-            self.command_queue.put(command)
-            Log.info(f"{header}: Command queued: {command}")
-            self.log_message(f"Command sent: {command}", "INFO")
+            self.command_queue.put(commands)
+            log.info("%s: Commands queued: %s", header, commands)
+            for command in commands:
+                self.log_message(f"Command sent: {command}", "INFO")
         else:
-            Log.warning(f"{header}: Cannot send command - not connected")
+            log.warning("%s: Cannot send commands %s - not connected", header, commands)
             self.log_message("Cannot send command: Not connected", "WARNING")
             messagebox.showwarning("Warning", "Not connected to Arduino")
 
@@ -684,13 +1023,22 @@ class TachometerGUI:
     """
     def update_gui_timer(self):
         try:
-            # Process all pending data updates
-            while not self.data_queue.empty():
-                data_type, data = self.data_queue.get_nowait()
-                
+            # Drain at most 64 items per tick so a burst cannot stall the UI;
+            # the rest is picked up by the next tick 20 ms later
+            items = []
+            get_nowait = self.data_queue.get_nowait
+            try:
+                for _ in range(64):
+                    items.append(get_nowait())
+            except queue.Empty:
+                pass
+            
+            # Every sample goes to the plot; displays only show the latest one
+            latest_data = None
+            for data_type, data in items:
                 if data_type == 'DATA':
-                    self.update_measurements(data)
                     self.add_data_to_plot(data)
+                    latest_data = data
                     
                 elif data_type == 'CONFIG':
                     self.update_configuration_display(data)
@@ -703,12 +1051,24 @@ class TachometerGUI:
                     
                 elif data_type == 'RAW':
                     self.log_message(f"Raw: {data}", "INFO")
+            
+            if self._iconic:
+                # Samples still reach the ring buffers; _on_map catches up the rest
+                if latest_data is not None:
+                    self._deferred_data = latest_data
+            else:
+                if latest_data is not None:
+                    self.update_measurements(latest_data)
+                
+                if self._log_pending:
+                    self._flush_log()
+            
                     
         except Exception as e:
-            Log.error(f"GUI update error: {str(e)}")
+            log.error(f"GUI update error: {str(e)}")
         
         # Schedule next update
-        self.root.after(50, self.update_gui_timer)
+        self.root.after(20, self.update_gui_timer)
 
 
     """
@@ -725,80 +1085,173 @@ class TachometerGUI:
     Update measurement displays with new data.
     """
     def update_measurements(self, data):
-        header = "TachometerGUI.update_measurements()"
-        
         try:
-            self.rpm_var.set(format_rpm_br(data['rpm']))
-            self.filtered_rpm_var.set(format_rpm_br(data['filtered_rpm']))
-            self.frequency_var.set(format_frequency_br(data['frequency']))
-            self.filtered_freq_var.set(format_frequency_br(data['filtered_freq']))
-            self.total_revs_var.set(format_revolutions_br(data['total_revs']))
-            self.pulse_interval_var.set(format_time_br(data['pulse_interval']))
+            # Only touch the Tk variables whose value actually changed
+            last_shown = self._last_shown
+            for field, var, formatter in self._measurement_fields:
+                value = data[field]
+                if value != last_shown[field]:
+                    last_shown[field] = value
+                    var.set(formatter(value))
             
-            Log.trace(f"{header}: Measurement displays updated successfully")
+            if log.TRACE_ENABLED:
+                log.trace("TachometerGUI.update_measurements(): Measurement displays updated successfully")
             
         except Exception as e:
-            Log.error(f"{header}: Error updating measurements - {str(e)}")
+            log.error(f"TachometerGUI.update_measurements(): Error updating measurements - {str(e)}")
 
 
     """
     Add new data point to plotting arrays.
     """
     def add_data_to_plot(self, data):
-        header = "TachometerGUI.add_data_to_plot()"
-        
         try:
-            current_time = time.time()
+            # Device clock: millis() at measurement time, independent of GUI lag
+            current_time = data['timestamp'] * 1e-3
+            
+            # millis() went backwards: the Arduino was reset, start a new trace
+            if self._count and current_time < self._buf_time[self._head - 1]:
+                self._head = 0
+                self._count = 0
+                self._bounds_stale = True
+            
+            head = self._head
+            rpm = data['rpm']
+            filtered_rpm = data['filtered_rpm']
+            frequency = data['frequency']
+            
+            # Buffer full: the sample at head is evicted. If it held a current
+            # extreme the bounds must be rescanned, otherwise they stay valid.
+            if self._count == self.max_data_points and not self._bounds_stale:
+                old_rpm = self._buf_rpm[head]
+                old_filtered_rpm = self._buf_filtered_rpm[head]
+                old_freq = self._buf_freq[head]
+                if (old_rpm == self._rpm_lo or old_rpm == self._rpm_hi
+                        or old_filtered_rpm == self._rpm_lo or old_filtered_rpm == self._rpm_hi
+                        or old_freq == self._freq_lo or old_freq == self._freq_hi):
+                    self._bounds_stale = True
             
-            self.time_data.append(current_time)
-            self.rpm_data.append(data['rpm'])
-            self.filtered_rpm_data.append(data['filtered_rpm'])
-            self.frequency_data.append(data['frequency'])
+            if not self._bounds_stale:
+                self._rpm_lo = min(self._rpm_lo, rpm, filtered_rpm)
+                self._rpm_hi = max(self._rpm_hi, rpm, filtered_rpm)
+                self._freq_lo = min(self._freq_lo, frequency)
+                self._freq_hi = max(self._freq_hi, frequency)
             
-            Log.trace(f"{header}: Plot data point added successfully")
+            self._buf_time[head] = current_time
+            self._buf_rpm[head] = rpm
+            self._buf_filtered_rpm[head] = filtered_rpm
+            self._buf_freq[head] = frequency
+            self._head = (head + 1) % self.max_data_points
+            if self._count < self.max_data_points:
+                self._count += 1
+            self._plot_dirty = True
+            
+            if log.TRACE_ENABLED:
+                log.trace("TachometerGUI.add_data_to_plot(): Plot data point added successfully")
             
         except Exception as e:
-            Log.error(f"{header}: Error adding plot data - {str(e)}")
+            log.error(f"TachometerGUI.add_data_to_plot(): Error adding plot data - {str(e)}")
 
 
     """
-    Update matplotlib plots with new data.
+    Update matplotlib plot lines with the buffered data (drawing is done by the caller).
+    Returns True when an axis was rescaled and the static background must be redrawn.
     """
-    def update_plots(self, frame):
-        header = "TachometerGUI.update_plots()"
+    def _refresh_plot(self):
+        if self._count < 2:
+            return False
         
-        if len(self.time_data) < 2:
-            return
+        # Calculate relative time (seconds since the oldest buffered sample), in place
+        rel_time = self._ordered(self._buf_time, self._rel_time)
+        np.subtract(rel_time, rel_time[0], out=rel_time)
+        rpm = self._ordered(self._buf_rpm, self._plot_rpm)
+        filtered_rpm = self._ordered(self._buf_filtered_rpm, self._plot_filtered_rpm)
+        frequency = self._ordered(self._buf_freq, self._plot_freq)
+        
+        # Update plot data
+        self.rpm_line.set_data(rel_time, rpm)
+        self.filtered_rpm_line.set_data(rel_time, filtered_rpm)
+        self.freq_line.set_data(rel_time, frequency)
         
+        # Full scan only after an extreme was evicted (or a reset)
+        if self._bounds_stale:
+            self._rpm_lo = min(rpm.min(), filtered_rpm.min())
+            self._rpm_hi = max(rpm.max(), filtered_rpm.max())
+            self._freq_lo = frequency.min()
+            self._freq_hi = frequency.max()
+            self._bounds_stale = False
+        
+        # Rescale axes only when the data leaves the current limits;
+        # matplotlib limit handling is the only part expected to raise
+        t_end = rel_time[-1]
         try:
-            # Calculate relative time
-            if len(self.time_data) > 0:
-                start_time = self.time_data[0]
-                rel_time = [t - start_time for t in self.time_data]
-                
-                # Update plot data
-                self.rpm_line.set_data(rel_time, list(self.rpm_data))
-                self.filtered_rpm_line.set_data(rel_time, list(self.filtered_rpm_data))
-                self.freq_line.set_data(rel_time, list(self.frequency_data))
-                
-                # Auto-scale axes
-                self.ax1.relim()
-                self.ax1.autoscale_view()
-                self.ax2.relim()
-                self.ax2.autoscale_view()
-                
-                Log.trace(f"{header}: Plots updated successfully")
-                
+            rescaled = self._rescale_axis(self.ax1, 'x', 0.0, t_end)
+            rescaled |= self._rescale_axis(self.ax2, 'x', 0.0, t_end)
+            rescaled |= self._rescale_axis(self.ax1, 'y', self._rpm_lo, self._rpm_hi)
+            rescaled |= self._rescale_axis(self.ax2, 'y', self._freq_lo, self._freq_hi)
         except Exception as e:
-            Log.error(f"{header}: Error updating plots - {str(e)}")
+            log.error(f"TachometerGUI._refresh_plot(): Error rescaling plots - {str(e)}")
+            return False
+        
+        if log.TRACE_ENABLED:
+            log.trace("TachometerGUI._refresh_plot(): Plots updated successfully")
+        return rescaled
+
+
+    """
+    Copy the filled part of a ring buffer into out in chronological order
+    (oldest first) and return that slice of out.
+    """
+    def _ordered(self, buf, out):
+        head = self._head
+        count = self._count
+        older = count - head
+        out[:older] = buf[head:count]
+        out[older:count] = buf[:head]
+        return out[:count]
+
+
+    """
+    Adjust one axis of a plot when data leaves its limits or the limits are
+    far larger than needed (y: 10% margin, x: doubling span; both with
+    hysteresis against per-frame rescaling).
+    Returns True if the limits were changed.
+    """
+    def _rescale_axis(self, ax, axis, data_min, data_max):
+        if axis == 'x':
+            # Time only grows while the buffer fills: double the span (from the
+            # initial 10 s) instead of adding a margin, so filling the window
+            # costs a few full draws rather than one per sample. It shrinks
+            # back only when the data drops below a quarter of it (buffer reset).
+            cur_max = ax.get_xlim()[1]
+            if cur_max / 4 <= data_max <= cur_max:
+                return False
+            new_max = 10.0
+            while new_max < data_max:
+                new_max *= 2
+            if new_max == cur_max:
+                return False
+            ax.set_xlim(0.0, new_max)
+            return True
+        
+        span = max(float(data_max - data_min), 1.0)
+        new_min = data_min - 0.1 * span
+        new_max = data_max + 0.1 * span
+        
+        cur_min, cur_max = ax.get_ylim()
+        if (data_min >= cur_min and data_max <= cur_max
+                and (cur_max - cur_min) <= 1.5 * (new_max - new_min)):
+            return False
+        
+        ax.set_ylim(new_min, new_max)
+        return True
 
 
     """
     Handle command responses from Arduino.
     """
     def handle_command_response(self, response):
-        header = "TachometerGUI.handle_command_response()"
-        Log.trace(f"{header}: Processing command response: {response}")
+        log.trace("TachometerGUI.handle_command_response(): Processing command response: %s", response)
         self.log_message(f"Response: {response}", "SUCCESS")
 
 
@@ -806,20 +1259,15 @@ class TachometerGUI:
     Handle system messages from Arduino.
     """
     def handle_system_message(self, message):
-        header = "TachometerGUI.handle_system_message()"
-        Log.trace(f"{header}: Processing system message: {message}")
-        
-        if message == "STARTUP":
-            Log.info(f"{header}: Arduino system starting up")
-            self.log_message("Arduino system starting up", "INFO")
-        elif message == "INIT_OK":
-            Log.info(f"{header}: Arduino initialization successful")
-            self.log_message("Arduino initialization successful", "SUCCESS")
-        elif message == "INIT_ERROR":
-            Log.error(f"{header}: Arduino initialization failed")
-            self.log_message("Arduino initialization failed", "ERROR")
+        log.trace("TachometerGUI.handle_system_message(): Processing system message: %s", message)
+        
+        entry = self._SYS_MSG_TABLE.get(message)
+        if entry is not None:
+            text, level, log_fn = entry
+            log_fn("TachometerGUI.handle_system_message(): %s", text)
+            self.log_message(text, level)
         else:
-            Log.info(f"{header}: System message: {message}")
+            log.info("TachometerGUI.handle_system_message(): System message: %s", message)
             self.log_message(f"System: {message}", "INFO")
 
 
@@ -828,37 +1276,40 @@ class TachometerGUI:
     """
     def update_configuration_display(self, config):
         header = "TachometerGUI.update_configuration_display()"
-        Log.trace(f"{header}: Updating configuration display")
+        if log.TRACE_ENABLED:
+            log.trace(f"{header}: Updating configuration display")
         
         try:
-            config_text = "Current System Configuration:\n"
-            config_text += "=" * 40 + "\n"
-            config_text += f"IR Sensor Pin: {config['ir_pin']}\n"
-            config_text += f"Sample Period: {config['sample_period']} ms\n"
-            config_text += f"Debounce Time: {config['debounce_time']} µs\n"
-            config_text += f"Pulses per Revolution: {config['pulses_per_rev']}\n"
-            config_text += f"Timer Number: {config['timer_number']}\n"
-            config_text += f"Filtering Enabled: {config['filtering_enabled']}\n"
-            config_text += f"Filter Alpha: {config['filter_alpha']}\n"
-            config_text += f"Window Size: {config['window_size']}\n"
-            config_text += f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            updated = _now_str()
+            config_text = self._CONFIG_TEMPLATE.format(updated=updated, **config)
             
-            self.config_text.delete(1.0, tk.END)
-            self.config_text.insert(1.0, config_text)
+            # Tabs not built yet pick these up in _lazy_tab
+            self._last_config_text = config_text
+            if 'config' in self._built:
+                if config == self._shown_config:
+                    # Same settings echoed back, only the timestamp moves
+                    self.config_text.replace(self._CONFIG_UPDATED_INDEX,
+                                             f"{self._CONFIG_UPDATED_INDEX} lineend",
+                                             updated)
+                else:
+                    self.config_text.replace(1.0, tk.END, config_text)
+                    self._shown_config = dict(config)
+                
+                self.debounce_var.set(config['debounce_time'])
+                self.period_var.set(config['sample_period'])
             
             # Update control widgets
-            self.alpha_var.set(config['filter_alpha'])
-            self.window_var.set(config['window_size'])
-            self.debounce_var.set(config['debounce_time'])
-            self.period_var.set(config['sample_period'])
-            
-            self.alpha_label.config(text=str(config['filter_alpha']))
-            self.window_label.config(text=str(config['window_size']))
+            if 'control' in self._built:
+                self.alpha_var.set(config['filter_alpha'])
+                self.window_var.set(config['window_size'])
+                
+                self.alpha_label.config(text=str(config['filter_alpha']))
+                self.window_label.config(text=str(config['window_size']))
             
-            Log.debug(f"{header}: Configuration display updated successfully")
+            log.debug(f"{header}: Configuration display updated successfully")
             
         except Exception as e:
-            Log.error(f"{header}: Error updating configuration display - {str(e)}")
+            log.error(f"{header}: Error updating configuration display - {str(e)}")
 
 
     """
@@ -866,11 +1317,12 @@ class TachometerGUI:
     """
     def on_alpha_change(self, value):
         header = "TachometerGUI.on_alpha_change()"
-        Log.trace(f"{header}: Processing alpha filter change")
+        if log.TRACE_ENABLED:
+            log.trace(f"{header}: Processing alpha filter change")
         alpha_val = int(float(value))
         self.alpha_label.config(text=str(alpha_val))
-        self.send_command(f"SET_ALPHA:{alpha_val}")
-        Log.debug(f"{header}: Alpha filter changed to {alpha_val}")
+        self._send_debounced("SET_ALPHA", f"SET_ALPHA:{alpha_val}")
+        log.debug(f"{header}: Alpha filter changed to {alpha_val}")
 
 
     """
@@ -878,11 +1330,12 @@ class TachometerGUI:
     """
     def on_window_change(self, value):
         header = "TachometerGUI.on_window_change()"
-        Log.trace(f"{header}: Processing window size change")
+        if log.TRACE_ENABLED:
+            log.trace(f"{header}: Processing window size change")
         window_val = int(float(value))
         self.window_label.config(text=str(window_val))
-        self.send_command(f"SET_WINDOW:{window_val}")
-        Log.debug(f"{header}: Window size changed to {window_val}")
+        self._send_debounced("SET_WINDOW", f"SET_WINDOW:{window_val}")
+        log.debug(f"{header}: Window size changed to {window_val}")
 
 
     """
@@ -890,10 +1343,11 @@ class TachometerGUI:
     """
     def on_debounce_change(self):
         header = "TachometerGUI.on_debounce_change()"
-        Log.trace(f"{header}: Processing debounce change event")
+        if log.TRACE_ENABLED:
+            log.trace(f"{header}: Processing debounce change event")
         debounce_val = self.debounce_var.get()
-        self.send_command(f"SET_DEBOUNCE:{debounce_val}")
-        Log.debug(f"{header}: Debounce time changed to {debounce_val} µs")
+        self._send_debounced("SET_DEBOUNCE", f"SET_DEBOUNCE:{debounce_val}")
+        log.debug(f"{header}: Debounce time changed to {debounce_val} µs")
 
 
     """
@@ -901,10 +1355,31 @@ class TachometerGUI:
     """
     def on_period_change(self):
         header = "TachometerGUI.on_period_change()"
-        Log.trace(f"{header}: Processing sample period change event")
+        if log.TRACE_ENABLED:
+            log.trace(f"{header}: Processing sample period change event")
         period_val = self.period_var.get()
-        self.send_command(f"SET_PERIOD:{period_val}")
-        Log.debug(f"{header}: Sample period changed to {period_val} ms")
+        self._send_debounced("SET_PERIOD", f"SET_PERIOD:{period_val}")
+        log.debug(f"{header}: Sample period changed to {period_val} ms")
+
+
+    """
+    Send a command once its control has been still for 100 ms. A newer value
+    for the same command cancels the pending send, so a slider drag or a
+    held spinbox arrow results in a single serial write.
+    """
+    def _send_debounced(self, key, command):
+        after_id = self._pending_sends.get(key)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._pending_sends[key] = self.root.after(100, self._send_pending, key, command)
+
+
+    """
+    Timer callback for _send_debounced.
+    """
+    def _send_pending(self, key, command):
+        self._pending_sends.pop(key, None)
+        self.send_command(command)
 
 
     """
@@ -912,42 +1387,96 @@ class TachometerGUI:
     """
     def apply_config_changes(self):
         header = "TachometerGUI.apply_config_changes()"
-        Log.trace(f"{header}: Applying configuration changes")
+        log.trace(f"{header}: Applying configuration changes")
         
         try:
             debounce_val = self.debounce_var.get()
             period_val = self.period_var.get()
             
-            self.send_command(f"SET_DEBOUNCE:{debounce_val}")
-            self.send_command(f"SET_PERIOD:{period_val}")
+            self.send_commands((f"SET_DEBOUNCE:{debounce_val}", f"SET_PERIOD:{period_val}"))
             
-            Log.info(f"{header}: Configuration changes applied successfully")
+            log.info(f"{header}: Configuration changes applied successfully")
             self.log_message("Configuration changes applied", "SUCCESS")
             
         except Exception as e:
-            Log.error(f"{header}: Error applying changes - {str(e)}")
+            log.error(f"{header}: Error applying changes - {str(e)}")
             self.log_message(f"Error applying changes: {str(e)}", "ERROR")
 
 
     """
     Add message to system log with timestamp.
+    The line is only queued here; update_gui_timer writes it to the widget.
     """
     def log_message(self, message, level="INFO"):
         header = "TachometerGUI.log_message()"
         
+        timestamp = _now_str()[11:]
+        # Levels without a configured tag color are inserted untagged
+        tag = level if level in self._LEVEL_TAGS else ""
+        self._log_pending.append((f"[{timestamp}] {level}: {message}\n", tag))
+        
+        if log.TRACE_ENABLED:
+            log.trace("%s: GUI log message added: %s", header, message)
+
+
+    """
+    Write all pending log lines to the log widget with a single insert,
+    keep it near max_log_lines and scroll once.
+    """
+    def _flush_log(self):
+        header = "TachometerGUI._flush_log()"
+        
+        if 'log' not in self._built or not self._log_pending:
+            return
+        
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            log_entry = f"[{timestamp}] {level}: {message}\n"
+            # Group consecutive lines with the same tag: insert() takes
+            # alternating text/tag arguments, so the whole batch is one call
+            args = []
+            block = []
+            block_tag = None
+            self._log_lines_since_trim += len(self._log_pending)
+            while self._log_pending:
+                entry, tag = self._log_pending.popleft()
+                if tag != block_tag and block:
+                    args.extend(("".join(block), block_tag))
+                    block = []
+                block.append(entry)
+                block_tag = tag
+            args.extend(("".join(block), block_tag))
             
-            self.log_text.insert(tk.END, log_entry, level)
+            self.log_text.insert(tk.END, *args)
+            self._log_bytes += "".join(args[::2]).encode('utf-8')
             
-            if self.auto_scroll_var.get():
-                self.log_text.see(tk.END)
-                
-            Log.trace(f"{header}: GUI log message added: {message}")
+            # Size check only every 256 lines: the widget may briefly exceed
+            # max_log_lines by that much, but most flushes skip the index query
+            if self._log_lines_since_trim >= 256:
+                self._log_lines_since_trim = 0
+                # Every entry ends in a newline, so 'end-1c' sits on an empty last line
+                line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+                overflow = line_count - self.max_log_lines
+                if overflow > 0:
+                    self.log_text.delete('1.0', f'{overflow + 1}.0')
+                    cut = 0
+                    for _ in range(overflow):
+                        cut = self._log_bytes.index(b'\n', cut) + 1
+                    del self._log_bytes[:cut]
+            
+            # Scroll once Tk is idle; further flushes before then share it
+            if self.auto_scroll_var.get() and not self._see_pending:
+                self._see_pending = True
+                self.root.after_idle(self._scroll_log_to_end)
                 
         except Exception as e:
-            Log.error(f"{header}: Error logging GUI message - {str(e)}")
+            log.error(f"{header}: Error flushing GUI log - {str(e)}")
+
+
+    """
+    Idle callback scheduled by _flush_log: scroll the log to its last line.
+    """
+    def _scroll_log_to_end(self):
+        self._see_pending = False
+        self.log_text.see(tk.END)
 
 
     """
@@ -955,9 +1484,10 @@ class TachometerGUI:
     """
     def clear_log(self):
         header = "TachometerGUI.clear_log()"
-        Log.trace(f"{header}: Clearing system log")
+        log.trace(f"{header}: Clearing system log")
         
         self.log_text.delete(1.0, tk.END)
+        self._log_bytes.clear()
         self.log_message("Log cleared", "INFO")
 
 
@@ -966,7 +1496,7 @@ class TachometerGUI:
     """
     def save_log(self):
         header = "TachometerGUI.save_log()"
-        Log.trace(f"{header}: Saving system log to file")
+        log.trace(f"{header}: Saving system log to file")
         
         try:
             filename = filedialog.asksaveasfilename(
@@ -976,15 +1506,16 @@ class TachometerGUI:
             )
             
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    log_content = self.log_text.get(1.0, tk.END)
-                    f.write(log_content)
+                self._flush_log()
+                # _log_bytes mirrors the widget, so nothing is copied out of Tk
+                with open(filename, 'wb') as f:
+                    f.write(self._log_bytes)
                 
-                Log.info(f"{header}: System log saved to {filename}")
+                log.info(f"{header}: System log saved to {filename}")
                 self.log_message(f"Log saved to {filename}", "SUCCESS")
                 
         except Exception as e:
-            Log.error(f"{header}: Error saving log - {str(e)}")
+            log.error(f"{header}: Error saving log - {str(e)}")
             self.log_message(f"Error saving log: {str(e)}", "ERROR")
             messagebox.showerror("Save Error", str(e))
 
@@ -994,17 +1525,17 @@ class TachometerGUI:
     """
     def on_closing(self):
         header = "TachometerGUI.on_closing()"
-        Log.trace(f"{header}: Application closing initiated")
+        log.trace(f"{header}: Application closing initiated")
         
         if self.is_connected:
-            Log.debug(f"{header}: Disconnecting before closing")
+            log.debug(f"{header}: Disconnecting before closing")
             self.disconnect()
         
-        Log.info(f"{header}: Closing log file")
-        Log.close_log_file()
+        log.info(f"{header}: Closing log file")
+        log.close_log_file()
         
         self.root.destroy()
-        Log.info(f"{header}: Application closed successfully")
+        log.info(f"{header}: Application closed successfully")
 
 
     """
@@ -1012,13 +1543,13 @@ class TachometerGUI:
     """
     def run(self):
         header = "TachometerGUI.run()"
-        Log.trace(f"{header}: Starting GUI main loop")
+        log.trace(f"{header}: Starting GUI main loop")
         
         # Initialize port list
         self.refresh_ports()
         
         # Start main loop
-        Log.debug(f"{header}: Entering tkinter main loop")
+        log.debug(f"{header}: Entering tkinter main loop")
         self.root.mainloop()
 
 
@@ -1029,22 +1560,22 @@ def main():
     header = "main()"
     
     # Initialize logging system early
-    Log.set_level(LogLevel.INFO)
-    Log.set_console_output(True)
+    log.set_level(LogLevel.INFO)
+    log.set_console_output(True)
     
-    Log.info(f"{header}: Starting Industrial Tachometer GUI application")
+    log.info(f"{header}: Starting Industrial Tachometer GUI application")
     
     try:
         app = TachometerGUI()
         app.run()
         
     except Exception as e:
-        Log.critical(f"{header}: Fatal application error - {str(e)}")
+        log.critical(f"{header}: Fatal application error - {str(e)}")
         messagebox.showerror("Fatal Error", f"Application failed to start: {str(e)}")
     
     finally:
-        Log.info(f"{header}: Application terminated")
-        Log.close_log_file()
+        log.info(f"{header}: Application terminated")
+        log.close_log_file()
 
 
 if __name__ == "__main__":